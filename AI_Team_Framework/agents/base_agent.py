@@ -1,18 +1,90 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import string
+import sys
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
+from .coalescer import PromptCoalescer
+from .summary import summary_digest, summary_text
 
-@dataclass
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+
+# ``slots=True`` needs Python 3.10; older interpreters get a plain frozen dataclass.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AgentTurn:
     agent_id: str
     content: str
     cost_usd: float = 0.0
     tokens: int = 0
 
+    def replayed(self) -> "AgentTurn":
+        """Return this turn as reused by another caller, at no extra cost."""
+
+        return replace(self, tokens=0, cost_usd=0.0)
+
+
+_PROMPT_FIELDS = tuple(
+    sys.intern(name) for name in ("agent_name", "agent_role", "project_objective", "project_memory")
+)
+_AGENT_NAME, _AGENT_ROLE, _PROJECT_OBJECTIVE, _PROJECT_MEMORY = _PROMPT_FIELDS
+
+
+class CompiledPrompt:
+    """Prompt template parsed once into literal and field segments.
+
+    Rendering joins the pre-split literals with the substituted values, which
+    avoids re-parsing the template through ``str.format`` on every turn.
+    Templates using conversions, format specs or attribute/index lookups fall
+    back to ``str.format``.
+    """
+
+    __slots__ = ("source", "_head", "_segments", "_fallback")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self._head = ""
+        self._segments: Tuple[Tuple[str, str], ...] = ()
+        self._fallback = False
+
+        literals: List[str] = []
+        fields: List[str] = []
+        pending = ""
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            pending += literal
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                self._fallback = True
+                return
+            literals.append(pending)
+            fields.append(sys.intern(field))
+            pending = ""
+        literals.append(pending)
+
+        self._head = literals[0]
+        self._segments = tuple(zip(fields, literals[1:]))
+
+    def __call__(self, values: Dict[str, str]) -> str:
+        if self._fallback:
+            return self.source.format(**values)
+        parts = [self._head]
+        for field, literal in self._segments:
+            parts.append(str(values[field]))
+            parts.append(literal)
+        return "".join(parts)
+
+    def __bool__(self) -> bool:
+        return bool(self.source)
+
 
 class BaseAgent:
     """Base class encapsulating common agent behaviour.
@@ -20,40 +92,135 @@ class BaseAgent:
     The default implementation simply echoes structured placeholders so that
     the orchestration flow can be exercised without real model calls. Concrete
     subclasses can override :meth:`compose_turn` to integrate with an API or
-    local model backend.
+    local model backend, issuing requests through the shared, pooled
+    :attr:`http` client when one is available.
     """
 
+    #: Agents whose provider exposes a batch endpoint set this to ``True`` and
+    #: override :meth:`acompose_batch`; the coordinator then groups their task
+    #: prompts per provider instead of sending one request per agent.
+    supports_batching = False
+
+    __slots__ = (
+        "agent_id",
+        "config",
+        "display_name",
+        "role",
+        "prompt_library",
+        "logger",
+        "http",
+        "coalescer",
+        "_prompt_cache",
+    )
+
     def __init__(
         self,
         agent_id: str,
         config: Dict,
-        prompt_library: Dict[str, str],
+        prompt_library: Dict[str, CompiledPrompt],
         logger: logging.Logger,
+        http: Optional["httpx.AsyncClient"] = None,
     ) -> None:
         self.agent_id = agent_id
         self.config = config
+        # Resolved once; these are read on every prompt and stub turn.
+        self.display_name = sys.intern(str(config.get("display_name", agent_id)))
+        self.role = sys.intern(str(config.get("role", "")))
         self.prompt_library = prompt_library
         self.logger = logger
+        self.http = http
+        self.coalescer = PromptCoalescer(replay=AgentTurn.replayed)
+        self._prompt_cache: Dict[Tuple[str, object, str, str], str] = {}
 
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
     def kickoff_round(self, context: Dict) -> AgentTurn:
-        prompt = self._format_prompt("kickoff_prompt", context)
+        prompt = self.render_prompt("kickoff_prompt", context)
         return self.compose_turn(prompt, context)
 
     def perform_task(self, context: Dict) -> AgentTurn:
-        prompt = self._format_prompt("task_prompt", context)
+        prompt = self.render_prompt("task_prompt", context)
         return self.compose_turn(prompt, context)
 
     def self_evaluate(self, context: Dict) -> AgentTurn:
-        prompt = self._format_prompt("self_eval_prompt", context)
+        prompt = self.render_prompt("self_eval_prompt", context)
         return self.compose_turn(prompt, context)
 
     def review_round(self, context: Dict) -> AgentTurn:
-        prompt = self._format_prompt("review_prompt", context)
+        prompt = self.render_prompt("review_prompt", context)
         return self.compose_turn(prompt, context)
 
+    # Asynchronous counterparts used by the coordinator so that independent
+    # turns can be awaited concurrently.
+    async def akickoff_round(self, context: Dict) -> AgentTurn:
+        prompt = self.render_prompt("kickoff_prompt", context)
+        return await self.dispatch(prompt, context)
+
+    async def aperform_task(self, context: Dict) -> AgentTurn:
+        prompt = self.render_prompt("task_prompt", context)
+        return await self.dispatch(prompt, context)
+
+    async def aself_evaluate(self, context: Dict) -> AgentTurn:
+        prompt = self.render_prompt("self_eval_prompt", context)
+        return await self.dispatch(prompt, context)
+
+    async def areview_round(self, context: Dict) -> AgentTurn:
+        prompt = self.render_prompt("review_prompt", context)
+        return await self.dispatch(prompt, context)
+
+    def render_prompt(self, prompt_key: str, context: Dict) -> str:
+        """Render the named prompt template for this agent and ``context``."""
+
+        # Agent identity, objective and project memory are fixed for a round,
+        # so each prompt only needs rendering once per round.
+        objective = context.get("objective", "")
+        project_memory = context.get("project_memory", "")
+        # Keyed on the strings themselves: their hashes are cached, and unlike
+        # id() a replaced string can never alias a freed one.
+        cache_key = (prompt_key, context.get("round"), objective, project_memory)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        template = self.prompt_library.get(prompt_key)
+        if not template:
+            self.logger.warning("Prompt '%s' missing for agent %s", prompt_key, self.agent_id)
+            return ""
+
+        populated = template(
+            {
+                _AGENT_NAME: self.display_name,
+                _AGENT_ROLE: self.role,
+                _PROJECT_OBJECTIVE: objective,
+                _PROJECT_MEMORY: project_memory,
+            }
+        )
+        self._prompt_cache[cache_key] = populated
+        return populated
+
+    async def dispatch(self, prompt: str, context: Optional[Dict]) -> AgentTurn:
+        """Compose a turn for an already rendered prompt.
+
+        Identical prompts are routed through the agent's coalescer, so a
+        repeat within the round is answered without another model call.
+        """
+
+        key = PromptCoalescer.make_key(self.agent_id, prompt, summary_digest(context))
+        return await self.coalescer.run(key, lambda: self.acompose_turn(prompt, context))
+
+    def reset_round_caches(self) -> None:
+        """Drop rendered prompts and coalesced turns from the previous round."""
+
+        self._prompt_cache.clear()
+        self.coalescer.clear()
+
+    @property
+    def batch_key(self) -> Optional[str]:
+        if not self.supports_batching:
+            return None
+        return self.config.get("provider")
+
     # ------------------------------------------------------------------
     # Extension hooks
     # ------------------------------------------------------------------
@@ -66,39 +233,71 @@ class BaseAgent:
         """
 
         self.logger.debug("Stub compose_turn invoked for %s", self.agent_id)
-        headline = self.config.get("role", "team member")
+        headline = self.role or "team member"
         response_lines: List[str] = [
-            f"[{self.config.get('display_name', self.agent_id)} | {headline}]",
+            f"[{self.display_name} | {headline}]",
             "Prompt summary:",
             prompt.strip(),
         ]
         if context:
-            summary = context.get("conversation_summary") or "(no summary yet)"
+            summary = summary_text(context) or "(no summary yet)"
             response_lines.append(f"Latest summary: {summary}")
         return AgentTurn(agent_id=self.agent_id, content="\n".join(response_lines))
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
-    def _format_prompt(self, prompt_key: str, context: Dict) -> str:
-        template = self.prompt_library.get(prompt_key, "")
-        if not template:
-            self.logger.warning("Prompt '%s' missing for agent %s", prompt_key, self.agent_id)
-            return ""
+    async def acompose_turn(self, prompt: str, context: Optional[Dict]) -> AgentTurn:
+        """Asynchronously compose a response for a turn.
 
-        populated = template.format(
-            agent_name=self.config.get("display_name", self.agent_id),
-            agent_role=self.config.get("role", ""),
-            project_objective=context.get("objective", ""),
-            project_memory=context.get("project_memory", ""),
-        )
-        return populated
+        API-backed subclasses should override this with a native async client
+        call. The default runs :meth:`compose_turn` in a worker thread so that
+        blocking implementations do not stall the event loop.
+        """
+
+        return await asyncio.to_thread(self.compose_turn, prompt, context)
+
+    async def astream_turn(self, prompt: str, context: Optional[Dict]) -> AsyncIterator[AgentTurn]:
+        """Yield a turn incrementally as partial :class:`AgentTurn` chunks.
+
+        Each chunk carries a content delta plus the tokens and cost it
+        accounts for; :func:`collect_stream` folds them back into one turn.
+        Subclasses backed by a streaming API (``stream=True``/SSE) override
+        this. The default yields the whole coalesced turn as a single chunk.
+        """
+
+        yield await self.dispatch(prompt, context)
+
+    async def acompose_batch(
+        self,
+        requests: Sequence[Tuple["BaseAgent", str, Optional[Dict]]],
+    ) -> List[AgentTurn]:
+        """Compose turns for several same-provider prompts in one submission.
+
+        ``requests`` holds ``(agent, prompt, context)`` tuples and the returned
+        turns must preserve that order. Subclasses backed by a batch API
+        (OpenAI Batch, Anthropic Message Batches, vLLM multi-prompt generate)
+        override this; the default composes each request individually.
+        """
+
+        turns = await asyncio.gather(*(agent.dispatch(prompt, ctx) for agent, prompt, ctx in requests))
+        return list(turns)
+
+
+async def collect_stream(agent_id: str, chunks: AsyncIterator[AgentTurn]) -> AgentTurn:
+    """Fold streamed turn chunks into a single :class:`AgentTurn`."""
+
+    parts: List[str] = []
+    tokens = 0
+    cost_usd = 0.0
+    async for chunk in chunks:
+        parts.append(chunk.content)
+        tokens += chunk.tokens
+        cost_usd += chunk.cost_usd
+    return AgentTurn(agent_id=agent_id, content="".join(parts), cost_usd=cost_usd, tokens=tokens)
 
 
-def load_prompt_library(base_dir: Path, settings: Dict) -> Dict[str, str]:
-    """Load prompt templates declared in the settings file."""
+def load_prompt_library(base_dir: Path, settings: Dict) -> Dict[str, CompiledPrompt]:
+    """Load and compile prompt templates declared in the settings file."""
 
-    prompt_map: Dict[str, str] = {}
+    prompt_map: Dict[str, CompiledPrompt] = {}
     for key in [
         "kickoff_prompt",
         "task_prompt",
@@ -110,7 +309,7 @@ def load_prompt_library(base_dir: Path, settings: Dict) -> Dict[str, str]:
             continue
         prompt_path = base_dir / path_value
         try:
-            prompt_map[key] = prompt_path.read_text(encoding="utf-8")
+            prompt_map[key] = CompiledPrompt(prompt_path.read_text(encoding="utf-8"))
         except FileNotFoundError:
-            prompt_map[key] = ""
+            prompt_map[key] = CompiledPrompt("")
     return prompt_map
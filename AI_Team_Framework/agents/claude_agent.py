@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, CompiledPrompt
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
 
 
 class ClaudeAgent(BaseAgent):
     """Research synthesis specialist agent."""
 
-    def __init__(self, config: Dict, prompt_library: Dict[str, str], logger: logging.Logger) -> None:
-        super().__init__("claude", config, prompt_library, logger)
+    __slots__ = ()
+
+    def __init__(
+        self,
+        config: Dict,
+        prompt_library: Dict[str, CompiledPrompt],
+        logger: logging.Logger,
+        http: Optional["httpx.AsyncClient"] = None,
+    ) -> None:
+        super().__init__("claude", config, prompt_library, logger, http)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class PromptCoalescer:
+    """Single-flight cache for identical prompts.
+
+    Concurrent requests for the same key share one in-flight future, and the
+    result is kept in a bounded TTL/LRU cache so repeats later in the round
+    are answered without another model call. The coordinator clears the cache
+    at the start of every round.
+
+    Only the caller that ran the factory receives the original result; cache
+    hits and callers that waited on the in-flight future receive
+    ``replay(result)``, which lets agents strip the cost of a call they did
+    not pay for. If the leading caller is cancelled, its waiters retry
+    instead of inheriting the cancellation.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl_seconds: float = 900.0,
+        replay: Optional[Callable[[T], T]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.replay: Callable[[T], T] = replay or (lambda value: value)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._results: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(agent_id: str, prompt: str, summary: str = "") -> str:
+        return digest_parts(agent_id, prompt, summary).hex()
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            cached = self._get_cached(key)
+            if cached is not None:
+                return self.replay(cached)
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the leader was cancelled: run the prompt again, either
+                # as the new leader or behind whichever waiter got there first.
+                if inflight.cancelled() and not _current_task_cancelling():
+                    continue
+                raise
+            return self.replay(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved; waiters (if any) re-raise it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            self._store(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    # ------------------------------------------------------------------
+    def _get_cached(self, key: str) -> Optional[object]:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: object) -> None:
+        self._results[key] = (time.monotonic(), value)
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+
+def digest_parts(*parts: str) -> bytes:
+    """Hash ``parts`` as a sequence; the separators keep ("ab", "c") != ("a", "bc")."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def _current_task_cancelling() -> bool:
+    # Task.cancelling() only exists on Python 3.11+; older interpreters cannot
+    # tell a pending cancellation apart from the leader's, so they retry.
+    task = asyncio.current_task()
+    cancelling = getattr(task, "cancelling", None)
+    return bool(cancelling and cancelling())
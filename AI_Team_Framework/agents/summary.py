@@ -0,0 +1,54 @@
+"""Helpers for the running conversation summary stored on a round context.
+
+The summary is accumulated as a deque of entries under ``_summary_parts``
+rather than rebuilt as one growing string on every turn. Appending is O(1)
+in the summary length; the joined text is produced only when a consumer
+asks for it and is memoised by entry count, so readers between two appends
+(e.g. the per-cycle log snapshot and the agents of that cycle) share one
+join. Callers that only need to tell summaries apart use
+:func:`summary_digest`, a running hash updated on append, instead of
+hashing the joined text.
+"""
+from __future__ import annotations
+
+import hashlib
+from collections import deque
+from typing import Deque, Dict, Optional
+
+_PARTS_KEY = "_summary_parts"
+_CACHE_KEY = "_summary_cache"
+_DIGEST_KEY = "_summary_digest"
+
+
+def new_summary() -> Deque[str]:
+    return deque()
+
+
+def append_summary(context: Dict, entry: str) -> None:
+    context.setdefault(_PARTS_KEY, new_summary()).append(entry)
+    digest = context.setdefault(_DIGEST_KEY, hashlib.blake2b(digest_size=16))
+    digest.update(entry.encode("utf-8"))
+    digest.update(b"\0")
+
+
+def summary_text(context: Optional[Dict]) -> str:
+    if not context:
+        return ""
+    parts = context.get(_PARTS_KEY)
+    if not parts:
+        return ""
+    cached = context.get(_CACHE_KEY)
+    if cached is not None and cached[0] == len(parts):
+        return cached[1]
+    text = "\n".join(parts).strip()
+    context[_CACHE_KEY] = (len(parts), text)
+    return text
+
+
+def summary_digest(context: Optional[Dict]) -> str:
+    """Return a hex digest identifying the entries appended so far."""
+
+    digest = context.get(_DIGEST_KEY) if context else None
+    if digest is None:
+        return ""
+    return digest.hexdigest()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Sequence, Union
+
+from agents.base_agent import AgentTurn, BaseAgent, collect_stream
+
+
+class BatchDispatcher:
+    """Submits same-provider prompts of a talk-back cycle together.
+
+    Agents exposing the same :attr:`BaseAgent.batch_key` are grouped and sent
+    through a single :meth:`BaseAgent.acompose_batch` call; every other agent
+    takes the regular per-request path, consuming the agent's token stream as
+    it arrives. Groups are awaited concurrently and results are returned in
+    the order the agents were given.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+
+    async def dispatch(
+        self,
+        agents: Sequence[BaseAgent],
+        prompt_key: str,
+        context: Dict,
+    ) -> List[Union[AgentTurn, BaseException]]:
+        groups: Dict[str, List[int]] = {}
+        singles: List[int] = []
+        for index, agent in enumerate(agents):
+            key = agent.batch_key
+            if key:
+                groups.setdefault(key, []).append(index)
+            else:
+                singles.append(index)
+
+        # A "batch" of one gains nothing over the regular path.
+        for key in [key for key, members in groups.items() if len(members) == 1]:
+            singles.extend(groups.pop(key))
+
+        results: List[Union[AgentTurn, BaseException, None]] = [None] * len(agents)
+        jobs = [self._dispatch_single(agents[index], prompt_key, context) for index in singles]
+        jobs.extend(
+            self._dispatch_group([agents[index] for index in members], prompt_key, context)
+            for members in groups.values()
+        )
+        outcomes = await asyncio.gather(*jobs, return_exceptions=True)
+
+        for index, outcome in zip(singles, outcomes):
+            results[index] = outcome
+        for members, outcome in zip(groups.values(), outcomes[len(singles):]):
+            if isinstance(outcome, BaseException):
+                for index in members:
+                    results[index] = outcome
+                continue
+            for index, turn in zip(members, outcome):
+                results[index] = turn
+        return results  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    async def _dispatch_single(self, agent: BaseAgent, prompt_key: str, context: Dict) -> AgentTurn:
+        prompt = agent.render_prompt(prompt_key, context)
+        started = time.monotonic()
+        turn = await collect_stream(agent.agent_id, self._timed_stream(agent, prompt, context, started))
+        self.logger.debug("Stream from %s completed in %.2fs", agent.agent_id, time.monotonic() - started)
+        return turn
+
+    async def _timed_stream(self, agent: BaseAgent, prompt: str, context: Dict, started: float):
+        first = True
+        async for chunk in agent.astream_turn(prompt, context):
+            if first:
+                self.logger.debug("First chunk from %s after %.2fs", agent.agent_id, time.monotonic() - started)
+                first = False
+            yield chunk
+
+    async def _dispatch_group(self, agents: List[BaseAgent], prompt_key: str, context: Dict) -> List[AgentTurn]:
+        self.logger.debug("Batching %s prompts for provider %s", len(agents), agents[0].batch_key)
+        requests = [(agent, agent.render_prompt(prompt_key, context), context) for agent in agents]
+        turns = await agents[0].acompose_batch(requests)
+        if len(turns) != len(requests):
+            raise RuntimeError(
+                f"Batch for provider {agents[0].batch_key} returned {len(turns)} turns "
+                f"for {len(requests)} prompts"
+            )
+        return turns
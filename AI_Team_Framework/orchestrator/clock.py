@@ -0,0 +1,32 @@
+"""Second-granular timestamp helpers shared by the coordinator and rewards.
+
+Turns arrive in bursts, so formatted timestamps are cached per wall-clock
+second and every entry logged within the same second reuses one string.
+"""
+from __future__ import annotations
+
+import functools
+import time
+from datetime import datetime, timezone
+
+
+def log_timestamp() -> str:
+    """Local time as ``YYYY-MM-DD HH:MM:SS`` for conversation log entries."""
+
+    return _format_local(int(time.time()))
+
+
+def utc_isoformat() -> str:
+    """Naive UTC ISO-8601 timestamp (second precision) for reward records."""
+
+    return _format_utc_iso(int(time.time()))
+
+
+@functools.lru_cache(maxsize=4)
+def _format_local(second: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+
+@functools.lru_cache(maxsize=4)
+def _format_utc_iso(second: int) -> str:
+    return datetime.fromtimestamp(second, tz=timezone.utc).replace(tzinfo=None).isoformat()
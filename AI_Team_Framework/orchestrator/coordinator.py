@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 from agents.base_agent import AgentTurn
+from agents.coalescer import digest_parts
+from agents.summary import append_summary, new_summary, summary_digest, summary_text
+from . import jsonio
+from .batching import BatchDispatcher
+from .clock import log_timestamp
+from .log_writer import LogWriter
 from .reward_engine import RewardEngine
 
 
@@ -58,70 +64,133 @@ class Coordinator:
         self.log_dir = base_dir / settings.get("conversation_log_dir", "memory/logs")
         self.project_memory_path = base_dir / settings.get("project_memory_file", "memory/project_memory.md")
         self.output_path = base_dir / settings.get("output_file", "output/saved_outputs.md")
+        self.batch_dispatcher = BatchDispatcher(logger.getChild("batching"))
+        self.log_writer = LogWriter(logger.getChild("log_writer"))
+        self._project_memory_cache: Optional[Tuple[Tuple[int, int], str]] = None
+        self._last_review_digest: Optional[bytes] = None
+        self._last_review: Optional[AgentTurn] = None
+
+    async def __aenter__(self) -> "Coordinator":
+        await self.log_writer.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        try:
+            await asyncio.to_thread(self.reward_engine.flush)
+        finally:
+            await self.log_writer.close()
 
     # ------------------------------------------------------------------
     def run(self, rounds: int) -> None:
+        async def _run() -> None:
+            async with self:
+                await self.arun(rounds)
+
+        asyncio.run(_run())
+
+    async def arun(self, rounds: int) -> None:
         for round_index in range(1, rounds + 1):
             self.logger.info("Starting round %s", round_index)
             budget = BudgetTracker(self.limits)
             round_context = self._initial_round_context(round_index)
-            self._kickoff_round(round_context, budget)
-            self._run_task_phase(round_context, budget)
-            self._finalise_round(round_context, budget)
+            await self._kickoff_round(round_context, budget)
+            await self._run_task_phase(round_context, budget)
+            await self._finalise_round(round_context, budget)
+            await self.log_writer.flush()
             self.logger.info("Completed round %s", round_index)
 
     # ------------------------------------------------------------------
-    def _kickoff_round(self, context: Dict, budget: BudgetTracker) -> None:
+    async def _kickoff_round(self, context: Dict, budget: BudgetTracker) -> None:
         head_id = self.order[0]
         head_agent = self.agents[head_id]
-        turn = head_agent.kickoff_round(context)
+        turn = await head_agent.akickoff_round(context)
         self._persist_turn(turn, context)
         budget.register_turn(turn)
         self._check_budget(budget)
-        context["conversation_summary"] = turn.content
+        append_summary(context, turn.content)
 
-    def _run_task_phase(self, context: Dict, budget: BudgetTracker) -> None:
+    async def _run_task_phase(self, context: Dict, budget: BudgetTracker) -> None:
         talk_back_cycles = self.settings.get("talk_back_cycles", 0)
         for cycle in range(talk_back_cycles):
             self.logger.debug("Talk-back cycle %s", cycle + 1)
-            for agent_id in self._iter_task_agents():
-                agent = self.agents[agent_id]
-                turn = agent.perform_task(context)
-                self._persist_turn(turn, context)
+            # Every agent in a cycle sees the same context, so the calls are
+            # independent and can be awaited together (batched per provider
+            # where supported). Results are registered afterwards in speaking
+            # order to keep logs and summaries stable. A failing agent is
+            # logged and skipped; the rest of the cycle still counts.
+            agent_ids = list(self._iter_task_agents())
+            # Logged with every turn of the cycle: it is the summary the
+            # agents actually saw, not one that includes their peers' turns.
+            seen_summary = summary_text(context)
+            turns = await self.batch_dispatcher.dispatch(
+                [self.agents[agent_id] for agent_id in agent_ids],
+                "task_prompt",
+                context,
+            )
+            for agent_id, turn in zip(agent_ids, turns):
+                if isinstance(turn, BaseException):
+                    self.logger.error("Agent %s failed to perform task: %s", agent_id, turn, exc_info=turn)
+                    continue
+                self._persist_turn(turn, context, seen_summary)
                 budget.register_turn(turn)
-                self._check_budget(budget)
-                context["conversation_summary"] = self._update_summary(context, turn)
+                self._update_summary(context, turn)
                 self.reward_engine.record_contribution(agent_id, turn.content)
+            # Every turn of the cycle has already been paid for, so all of them
+            # are logged before a budget violation halts the run.
+            self._check_budget(budget)
 
-    def _finalise_round(self, context: Dict, budget: BudgetTracker) -> None:
+    async def _finalise_round(self, context: Dict, budget: BudgetTracker) -> None:
         reviewer_id = self.order[0]
         reviewer = self.agents[reviewer_id]
-        review_turn = reviewer.review_round(context)
-        self._persist_turn(review_turn, context)
-        budget.register_turn(review_turn)
-        self._check_budget(budget)
-        context["conversation_summary"] = self._update_summary(context, review_turn)
+        # A round whose review inputs match the previous one (e.g. no
+        # talk-back cycles, unchanged project memory and kickoff) would get
+        # the same review again.
+        review_digest = self._review_digest(reviewer_id, context)
+        if review_digest == self._last_review_digest and self._last_review is not None:
+            self.logger.info("Review inputs unchanged; reusing previous review (no-op review)")
+            # Nothing was spent on the reused review, so it is logged as free.
+            review_turn = self._last_review.replayed()
+            self._persist_turn(review_turn, context)
+        else:
+            review_turn = await reviewer.areview_round(context)
+            self._persist_turn(review_turn, context)
+            budget.register_turn(review_turn)
+            self._check_budget(budget)
+            self._last_review_digest = review_digest
+            self._last_review = review_turn
+        self._update_summary(context, review_turn)
         self._append_round_summary(context)
+        await asyncio.to_thread(self.reward_engine.flush)
 
     # ------------------------------------------------------------------
-    def _persist_turn(self, turn: AgentTurn, context: Dict) -> None:
+    def _persist_turn(self, turn: AgentTurn, context: Dict, summary: Optional[str] = None) -> None:
         log_path = self.log_dir / f"{turn.agent_id}_log.md"
-        log_entry = self._format_log_entry(turn, context)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as handle:
-            handle.write(log_entry + "\n\n")
-        self.logger.debug("Logged turn for %s", turn.agent_id)
+        log_entry = self._format_log_entry(turn, context, summary)
+        self.log_writer.submit(log_path, log_entry + b"\n\n")
+        self.logger.debug("Queued log entry for %s", turn.agent_id)
 
-    def _format_log_entry(self, turn: AgentTurn, context: Dict) -> str:
+    def _format_log_entry(self, turn: AgentTurn, context: Dict, summary: Optional[str] = None) -> bytes:
+        if summary is None:
+            summary = summary_text(context)
         entry = {
             "agent": turn.agent_id,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": log_timestamp(),
             "tokens": turn.tokens,
             "cost": turn.cost_usd,
-            "summary": context.get("conversation_summary", ""),
+            "summary": summary,
             "content": turn.content,
         }
-        return json.dumps(entry, ensure_ascii=False, indent=2)
+        return jsonio.dumps(entry)
+
+    def _review_digest(self, reviewer_id: str, context: Dict) -> bytes:
+        # Everything the reviewer receives except the round number, which
+        # changes every round without changing what is reviewed. Prompt
+        # templates and agent identities are fixed for the run.
+        parts = [reviewer_id, summary_digest(context)]
+        for key in sorted(context):
+            if key != "round" and not key.startswith("_"):
+                parts.extend((key, str(context[key])))
+        return digest_parts(*parts)
 
     def _check_budget(self, tracker: BudgetTracker) -> None:
         violation = tracker.check_limits()
@@ -130,27 +199,39 @@ class Coordinator:
             if self.limits.get("auto_pause", True):
                 raise RuntimeError(violation)
 
-    def _update_summary(self, context: Dict, turn: AgentTurn) -> str:
-        summary = context.get("conversation_summary", "")
-        updated = f"{summary}\n{turn.agent_id}: {turn.content.strip()}".strip()
-        return updated
+    def _update_summary(self, context: Dict, turn: AgentTurn) -> None:
+        append_summary(context, f"{turn.agent_id}: {turn.content.strip()}")
 
     def _append_round_summary(self, context: Dict) -> None:
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.output_path.open("a", encoding="utf-8") as handle:
-            handle.write(f"\n## Round Summary\n\n{context.get('conversation_summary', '').strip()}\n")
+        summary = summary_text(context)
+        self.log_writer.submit(self.output_path, f"\n## Round Summary\n\n{summary}\n".encode("utf-8"))
 
     def _initial_round_context(self, round_index: int) -> Dict:
-        project_memory = ""
-        if self.project_memory_path.exists():
-            project_memory = self.project_memory_path.read_text(encoding="utf-8")
+        for agent in self.agents.values():
+            agent.reset_round_caches()
         return {
             "round": round_index,
             "objective": self.settings.get("round_objective", ""),
-            "project_memory": project_memory,
-            "conversation_summary": "",
+            "project_memory": self._load_project_memory(),
+            "_summary_parts": new_summary(),
         }
 
+    def _load_project_memory(self) -> str:
+        """Return project memory, re-reading the file only when it has changed."""
+
+        try:
+            stat = self.project_memory_path.stat()
+        except FileNotFoundError:
+            self._project_memory_cache = None
+            return ""
+        # The size catches edits made within one tick of a coarse mtime.
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._project_memory_cache and self._project_memory_cache[0] == signature:
+            return self._project_memory_cache[1]
+        project_memory = self.project_memory_path.read_text(encoding="utf-8")
+        self._project_memory_cache = (signature, project_memory)
+        return project_memory
+
     def _iter_task_agents(self) -> Iterable[str]:
         if len(self.order) <= 1:
             return []
@@ -0,0 +1,30 @@
+"""JSON helpers that use ``orjson`` when it is installed.
+
+``orjson`` is an optional accelerator; without it the standard library
+``json`` module produces the same indented UTF-8 output.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses it
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialise ``payload`` as two-space indented UTF-8 JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=str, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
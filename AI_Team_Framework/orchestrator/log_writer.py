@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+
+class LogWriter:
+    """Appends log entries from a background task through kept-open handles.
+
+    Callers hand entries to :meth:`submit`, which only enqueues them, so the
+    coordinator's hot path never waits on the filesystem. The drain task
+    reaps up to ``max_batch`` queued entries at a time and issues a single
+    write per path for them from a worker thread. Handles are opened lazily
+    per path and flushed at round boundaries via :meth:`flush`, which
+    re-raises the first write failure since the previous flush. When the
+    writer has not been started, entries are written synchronously.
+    """
+
+    def __init__(self, logger: logging.Logger, max_batch: int = 32) -> None:
+        self.logger = logger
+        self.max_batch = max_batch
+        self._handles: Dict[Path, BinaryIO] = {}
+        self._queue: Optional["asyncio.Queue[Tuple[Path, bytes]]"] = None
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._drain())
+
+    def submit(self, path: Path, data: bytes) -> None:
+        """Queue already-encoded UTF-8 ``data`` for appending to ``path``."""
+
+        if self._queue is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("ab") as handle:
+                handle.write(data)
+            return
+        self._queue.put_nowait((path, data))
+
+    async def flush(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+        await asyncio.to_thread(self._flush_handles)
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    async def close(self) -> None:
+        try:
+            await self.flush()
+        finally:
+            if self._task is not None:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            self._task = None
+            self._queue = None
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+    # ------------------------------------------------------------------
+    async def _drain(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # task_done() must run for every entry, whatever happens, or
+            # flush() would wait on the queue forever.
+            try:
+                pending: Dict[Path, List[bytes]] = {}
+                for path, data in batch:
+                    pending.setdefault(path, []).append(data)
+                await asyncio.to_thread(self._write_batch, pending)
+            except Exception as exc:
+                self._record_error(exc, "Failed to write %s log entries: %s", len(batch), exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, pending: Dict[Path, List[bytes]]) -> None:
+        for path, chunks in pending.items():
+            try:
+                self._write(path, b"".join(chunks))
+            except Exception as exc:
+                self._record_error(exc, "Failed to write %s log entries to %s: %s", len(chunks), path, exc)
+
+    def _record_error(self, exc: BaseException, message: str, *args: object) -> None:
+        self.logger.error(message, *args, exc_info=exc)
+        if self._error is None:
+            self._error = exc
+
+    def _write(self, path: Path, data: bytes) -> None:
+        handle = self._handles.get(path)
+        if handle is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = path.open("ab")
+            self._handles[path] = handle
+        handle.write(data)
+
+    def _flush_handles(self) -> None:
+        for path, handle in self._handles.items():
+            try:
+                handle.flush()
+            except Exception as exc:
+                self._record_error(exc, "Failed to flush log file %s: %s", path, exc)
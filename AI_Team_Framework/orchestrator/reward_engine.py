@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
+import os
+import re
+from itertools import islice
 from pathlib import Path
 from typing import Dict
 
+from . import jsonio
+from .clock import utc_isoformat
+
+# Matches the start of every line containing a non-whitespace character.
+_NONBLANK_LINE = re.compile(r"(?m)^[^\S\r\n]*\S")
+_MAX_LINE_SCORE = 5
+
 
 class RewardEngine:
     """Simple reward tracker persisting agent performance metrics."""
@@ -16,37 +24,51 @@ class RewardEngine:
         self.rewards_path = base_dir / "rewards" / "agent_scores.json"
         self.rewards_path.parent.mkdir(parents=True, exist_ok=True)
         self._scores = self._load_scores()
+        self._dirty = False
 
     # ------------------------------------------------------------------
     def record_contribution(self, agent_id: str, content: str) -> None:
         score_delta = self._score_from_content(content)
         entry = self._scores.setdefault(agent_id, {"score": 0, "last_updated": None})
         entry["score"] = entry.get("score", 0) + score_delta
-        entry["last_updated"] = datetime.utcnow().isoformat()
-        self._persist()
+        entry["last_updated"] = utc_isoformat()
+        self._dirty = True
         self.logger.debug("Recorded contribution for %s (Δ=%s)", agent_id, score_delta)
 
     def get_scores(self) -> Dict[str, Dict]:
         return self._scores
 
+    def flush(self) -> None:
+        """Write pending score changes to disk, if any."""
+
+        if not self._dirty:
+            return
+        self._persist()
+        self._dirty = False
+
     # ------------------------------------------------------------------
     def _score_from_content(self, content: str) -> int:
         """Naive heuristic: reward longer, structured contributions."""
 
         if not content:
             return 0
-        lines = [line for line in content.splitlines() if line.strip()]
-        return max(1, min(len(lines), 5))
+        # Stop scanning once the cap is reached instead of splitting the whole
+        # contribution into lines.
+        lines = sum(1 for _ in islice(_NONBLANK_LINE.finditer(content), _MAX_LINE_SCORE))
+        return max(1, lines)
 
     def _load_scores(self) -> Dict:
         if not self.rewards_path.exists():
             return {}
         try:
-            return json.loads(self.rewards_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            return jsonio.loads(self.rewards_path.read_bytes())
+        except jsonio.JSONDecodeError:
             self.logger.warning("Failed to parse rewards file; resetting.")
             return {}
 
     def _persist(self) -> None:
-        with self.rewards_path.open("w", encoding="utf-8") as handle:
-            json.dump(self._scores, handle, indent=2)
+        # Write to a sibling file and swap it in so a crash mid-write never
+        # leaves a truncated scores file behind.
+        tmp_path = self.rewards_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(jsonio.dumps(self._scores))
+        os.replace(tmp_path, self.rewards_path)
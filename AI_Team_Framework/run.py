@@ -1,28 +1,44 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import functools
+import importlib
+import importlib.util
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Type
 
-from agents.base_agent import load_prompt_library
-from agents.claude_agent import ClaudeAgent
-from agents.deepseek_agent import DeepSeekAgent
-from agents.gemini_agent import GeminiAgent
-from agents.gpt_agent import GPTAgent
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None
+
+from agents.base_agent import BaseAgent, CompiledPrompt, load_prompt_library
+from orchestrator import jsonio
 from orchestrator.coordinator import Coordinator
 from orchestrator.reward_engine import RewardEngine
 
 
+# Agent classes are imported on first use so that provider SDKs are only
+# loaded for the agents a run actually configures.
 AGENT_FACTORY = {
-    "gemini": GeminiAgent,
-    "claude": ClaudeAgent,
-    "gpt": GPTAgent,
-    "deepseek": DeepSeekAgent,
+    "gemini": ("agents.gemini_agent", "GeminiAgent"),
+    "claude": ("agents.claude_agent", "ClaudeAgent"),
+    "gpt": ("agents.gpt_agent", "GPTAgent"),
+    "deepseek": ("agents.deepseek_agent", "DeepSeekAgent"),
 }
 
 
+@functools.lru_cache(maxsize=None)
+def resolve_agent_class(agent_id: str) -> Optional[Type[BaseAgent]]:
+    target = AGENT_FACTORY.get(agent_id)
+    if target is None:
+        return None
+    module_name, class_name = target
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def configure_logging(level: str) -> logging.Logger:
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     logging.basicConfig(
@@ -35,23 +51,52 @@ def configure_logging(level: str) -> logging.Logger:
 def load_json(path: Path) -> Dict:
     if not path.exists():
         raise FileNotFoundError(f"Missing configuration file: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return jsonio.loads(path.read_bytes())
+
+
+def create_http_client(settings: Dict, logger: logging.Logger) -> Optional["httpx.AsyncClient"]:
+    """Build the pooled HTTP client shared by every agent, if httpx is installed."""
+
+    if httpx is None:
+        logger.debug("httpx not installed; agents run without a shared HTTP client")
+        return None
+    http2 = importlib.util.find_spec("h2") is not None
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        retries=2,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+    timeout = httpx.Timeout(float(settings.get("default_turn_timeout_seconds", 120)), connect=5.0)
+    return httpx.AsyncClient(transport=transport, timeout=timeout)
 
 
-def initialise_agents(agent_config: Dict, prompt_library: Dict[str, str], logger: logging.Logger):
+def initialise_agents(
+    agent_config: Dict,
+    prompt_library: Dict[str, CompiledPrompt],
+    logger: logging.Logger,
+    http: Optional["httpx.AsyncClient"] = None,
+):
     agents = {}
     for spec in agent_config.get("agents", []):
         agent_id = spec["id"]
-        factory = AGENT_FACTORY.get(agent_id)
+        factory = resolve_agent_class(agent_id)
         if not factory:
             logger.warning("No factory registered for agent '%s'", agent_id)
             continue
         agent_logger = logging.getLogger(f"ai_orchestra.agent.{agent_id}")
-        agents[agent_id] = factory(spec, prompt_library, agent_logger)
+        agents[agent_id] = factory(spec, prompt_library, agent_logger, http)
     return agents
 
 
+async def run_rounds(coordinator: Coordinator, rounds: int, http: Optional["httpx.AsyncClient"] = None) -> None:
+    try:
+        async with coordinator:
+            await coordinator.arun(rounds=rounds)
+    finally:
+        if http is not None:
+            await http.aclose()
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the AI Orchestra prototype")
     parser.add_argument("--base-dir", default=Path(__file__).resolve().parent, type=Path)
@@ -73,23 +118,30 @@ def main() -> None:
     prompt_library = load_prompt_library(base_dir, settings)
     reward_engine = RewardEngine(base_dir, logger.getChild("rewards"))
 
-    agents = initialise_agents(agent_config, prompt_library, logger)
-    if not agents:
-        raise RuntimeError("No agents could be initialised. Check config/agents.json")
-
-    rounds = args.rounds or settings.get("rounds", 1)
-    coordinator = Coordinator(
-        base_dir=base_dir,
-        agents=agents,
-        config=agent_config,
-        settings=settings,
-        limits=limits,
-        reward_engine=reward_engine,
-        logger=logger.getChild("coordinator"),
-    )
+    http = create_http_client(settings, logger)
+    try:
+        agents = initialise_agents(agent_config, prompt_library, logger, http)
+        if not agents:
+            raise RuntimeError("No agents could be initialised. Check config/agents.json")
+
+        rounds = args.rounds or settings.get("rounds", 1)
+        coordinator = Coordinator(
+            base_dir=base_dir,
+            agents=agents,
+            config=agent_config,
+            settings=settings,
+            limits=limits,
+            reward_engine=reward_engine,
+            logger=logger.getChild("coordinator"),
+        )
+    except BaseException:
+        # run_rounds() closes the client once it runs; close it here if setup fails first.
+        if http is not None:
+            asyncio.run(http.aclose())
+        raise
 
     try:
-        coordinator.run(rounds=rounds)
+        asyncio.run(run_rounds(coordinator, rounds, http))
     except RuntimeError as exc:
         logger.error("Run halted: %s", exc)
 
@@ -2,11 +2,21 @@
 """Entry point for executing a single AionOS orchestration cycle."""
 from __future__ import annotations
 
+import asyncio
 import json
+import re
+import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_DIR = BASE_DIR / "config"
@@ -15,6 +25,32 @@ LOGS_DIR = BASE_DIR / "logs"
 PROJECTS_DIR = BASE_DIR / "projects"
 REWARDS_DIR = BASE_DIR / "rewards"
 
+# Scripted message bodies, kept pre-joined so crafting a message is a single
+# substitution rather than a chain of concatenated fragments.
+_ORCHESTRATOR_ASSIGNMENTS = (
+    "Claude, please explore the orchestration workflow and identify the key stages. "
+    "ChatGPT, prepare to refine Claude's findings into a crisp narrative."
+)
+_RESEARCHER_MESSAGE = (
+    "Building from the provided context, I propose outlining the AionOS workflow in three phases: "
+    "preparation, collaboration, and consolidation. In preparation, Gemini frames the problem and "
+    "aligns expectations. During collaboration, Claude examines reference material and surfaces "
+    "insights about agent roles, while ChatGPT distills them into actionable guidance. Consolidation "
+    "captures Gemini's evaluation, updates performance scores, and archives logs for transparency."
+)
+_EDITOR_MESSAGE = (
+    "Summarizing Claude's exploration: AionOS cycles begin with Gemini setting intent, which keeps the "
+    "crew aligned on context and deliverables. Claude then investigates the brief to surface the major "
+    "concepts and opportunities. ChatGPT reformats those ideas into a structured overview that highlights "
+    "workflow stages, evaluation mechanics, and the importance of persistent logs. This rhythm reinforces "
+    "a culture of trust and measurable improvement."
+)
+_CLOSING_MESSAGE = (
+    "Thank you both. Claude spotlighted how preparation, collaboration, and consolidation define the "
+    "cycle. ChatGPT distilled that into an accessible overview highlighting how evaluations and logs "
+    "drive trust. I'll record this session and update performance metrics accordingly."
+)
+
 
 @dataclass
 class AgentProfile:
@@ -31,22 +67,42 @@ class AgentProfile:
     def from_config(cls, key: str, payload: Dict[str, object]) -> "AgentProfile":
         return cls(
             key=key,
-            name=str(payload.get("name", key.title())),
-            role=str(payload.get("role", "Agent")),
+            name=sys.intern(str(payload.get("name", key.title()))),
+            role=sys.intern(str(payload.get("role", "Agent"))),
             description=str(payload.get("description", "")),
             privileges=list(payload.get("privileges", [])),
             voice=str(payload.get("voice", "")),
         )
 
 
+_WORD = re.compile(r"\S+")
+_EFFICIENT_WORD_LIMIT = 140
+
+_last_iso_second = -1
+_last_iso = ""
+
+
+def iso_now() -> str:
+    """UTC ISO-8601 timestamp at second precision, reused within a second."""
+
+    global _last_iso_second, _last_iso
+    second = int(time.time())
+    if second != _last_iso_second:
+        _last_iso = datetime.fromtimestamp(second, tz=timezone.utc).isoformat(timespec="seconds")
+        _last_iso_second = second
+    return _last_iso
+
+
 def load_json(path: Path) -> Dict[str, object]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def load_text(path: Path) -> str:
-    with path.open("r", encoding="utf-8") as handle:
-        return handle.read().strip()
+    # Text mode keeps universal-newline translation for the CRLF prompt files.
+    return path.read_text(encoding="utf-8").strip()
 
 
 def append_to_log(path: Path, content: str) -> None:
@@ -56,43 +112,35 @@ def append_to_log(path: Path, content: str) -> None:
 
 
 def format_conversation_entry(agent: AgentProfile, message: str) -> str:
-    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    header = f"[{timestamp}] {agent.name} ({agent.role}):"
-    return f"{header}\n{message.strip()}\n\n"
+    timestamp = iso_now()
+    return f"[{timestamp}] {agent.name} ({agent.role}):\n{message.strip()}\n\n"
 
 
 def craft_orchestrator_message(agent: AgentProfile, context: str) -> str:
     return (
         f"Greetings team, this is {agent.name}. Our focus is the current project brief. "
-        f"Here is the essential context we will work from:\n\n{context}\n\n"
-        "Claude, please explore the orchestration workflow and identify the key stages. "
-        "ChatGPT, prepare to refine Claude's findings into a crisp narrative."
+        f"Here is the essential context we will work from:\n\n{context}\n\n{_ORCHESTRATOR_ASSIGNMENTS}"
     )
 
 
 def craft_researcher_message(agent: AgentProfile, context: str) -> str:
-    return (
-        "Building from the provided context, I propose outlining the AionOS workflow in three phases: "
-        "preparation, collaboration, and consolidation. In preparation, Gemini frames the problem and "
-        "aligns expectations. During collaboration, Claude examines reference material and surfaces "
-        "insights about agent roles, while ChatGPT distills them into actionable guidance. Consolidation "
-        "captures Gemini's evaluation, updates performance scores, and archives logs for transparency."
-    )
+    return _RESEARCHER_MESSAGE
 
 
 def craft_editor_message(agent: AgentProfile, researcher_message: str) -> str:
-    return (
-        "Summarizing Claude's exploration: AionOS cycles begin with Gemini setting intent, which keeps the "
-        "crew aligned on context and deliverables. Claude then investigates the brief to surface the major "
-        "concepts and opportunities. ChatGPT reformats those ideas into a structured overview that highlights "
-        "workflow stages, evaluation mechanics, and the importance of persistent logs. This rhythm reinforces "
-        "a culture of trust and measurable improvement."
-    )
+    return _EDITOR_MESSAGE
+
+
+def count_words(message: str, limit: Optional[int] = None) -> int:
+    """Count whitespace-separated words, stopping early once ``limit`` is reached."""
+
+    return sum(1 for _ in islice(_WORD.finditer(message), limit))
 
 
 def rate_contribution(message: str) -> Dict[str, int]:
-    word_count = len(message.split())
-    efficiency = 5 if word_count <= 140 else 3
+    # Only whether the message exceeds the limit matters, so stop counting there.
+    word_count = count_words(message, _EFFICIENT_WORD_LIMIT + 1)
+    efficiency = 5 if word_count <= _EFFICIENT_WORD_LIMIT else 3
     insight = 5 if "workflow" in message.lower() else 3
     collaboration = 4
     trust_delta = 2 if insight >= 5 else 1
@@ -105,18 +153,24 @@ def rate_contribution(message: str) -> Dict[str, int]:
 
 
 def build_self_reflection(agent: AgentProfile, prompt: str, message: str) -> str:
-    clarity_score = max(6, min(10, 10 - max(0, (len(message.split()) - 120) // 20)))
-    usefulness_score = max(6, min(10, 7 + ("workflow" in message.lower()) + ("evaluation" in message.lower())))
+    lowered = message.lower()
+    clarity_score = max(6, min(10, 10 - max(0, (count_words(message) - 120) // 20)))
+    usefulness_score = max(6, min(10, 7 + ("workflow" in lowered) + ("evaluation" in lowered)))
     reflection = (
         f"{prompt}\n"
         f"Clarity: {clarity_score}/10\n"
         f"Usefulness: {usefulness_score}/10\n"
         f"Notes: As {agent.role}, I will iterate on brevity while preserving detail."
     )
-    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    timestamp = iso_now()
     return f"## {timestamp}\n{reflection}\n\n"
 
 
+async def build_and_log_reflection(agent: AgentProfile, prompt: str, message: str, path: Path) -> None:
+    reflection = build_self_reflection(agent, prompt, message)
+    await asyncio.to_thread(append_to_log, path, reflection)
+
+
 def update_rewards(scores: Dict[str, Dict[str, int]], agent_key: str, deltas: Dict[str, int]) -> None:
     agent_scores = scores.setdefault(agent_key, {})
     agent_scores["efficiency"] = agent_scores.get("efficiency", 0) + deltas["efficiency"]
@@ -127,7 +181,7 @@ def update_rewards(scores: Dict[str, Dict[str, int]], agent_key: str, deltas: Di
     agent_scores["trust_score"] = max(0, min(100, trust))
 
 
-def main() -> None:
+async def main() -> None:
     agents_config = load_json(CONFIG_DIR / "agents.json")
     agent_profiles = {
         key: AgentProfile.from_config(key, payload)
@@ -140,6 +194,11 @@ def main() -> None:
     self_eval_prompt = load_text(PROMPTS_DIR / "self_eval_prompt.txt")
 
     conversation: List[str] = []
+    # Self evaluations only depend on their own agent's message, so each one
+    # is scheduled as soon as that message exists. Yielding once lets the task
+    # build its reflection and hand the log append to a worker thread, which
+    # then runs alongside the rest of the conversation.
+    reflection_tasks: List[asyncio.Task] = []
 
     # Gemini initiates
     gemini = agent_profiles["gemini"]
@@ -150,26 +209,28 @@ def main() -> None:
     claude = agent_profiles["claude"]
     claude_message = craft_researcher_message(claude, project_context)
     conversation.append(format_conversation_entry(claude, claude_message))
+    reflection_tasks.append(
+        asyncio.create_task(
+            build_and_log_reflection(claude, self_eval_prompt, claude_message, LOGS_DIR / "claude_log.md")
+        )
+    )
+    await asyncio.sleep(0)
 
     # ChatGPT refines
     chatgpt = agent_profiles["chatgpt"]
     chatgpt_message = craft_editor_message(chatgpt, claude_message)
     conversation.append(format_conversation_entry(chatgpt, chatgpt_message))
-
-    # Self evaluations
-    claude_reflection = build_self_reflection(claude, self_eval_prompt, claude_message)
-    append_to_log(LOGS_DIR / "claude_log.md", claude_reflection)
-
-    chatgpt_reflection = build_self_reflection(chatgpt, self_eval_prompt, chatgpt_message)
-    append_to_log(LOGS_DIR / "chatgpt_log.md", chatgpt_reflection)
+    reflection_tasks.append(
+        asyncio.create_task(
+            build_and_log_reflection(chatgpt, self_eval_prompt, chatgpt_message, LOGS_DIR / "chatgpt_log.md")
+        )
+    )
+    await asyncio.sleep(0)
 
     # Gemini finalizes
-    final_summary = (
-        "Thank you both. Claude spotlighted how preparation, collaboration, and consolidation define the "
-        "cycle. ChatGPT distilled that into an accessible overview highlighting how evaluations and logs "
-        "drive trust. I'll record this session and update performance metrics accordingly."
-    )
-    conversation.append(format_conversation_entry(gemini, final_summary))
+    conversation.append(format_conversation_entry(gemini, _CLOSING_MESSAGE))
+
+    await asyncio.gather(*reflection_tasks)
 
     # Update rewards
     rewards_path = REWARDS_DIR / "agent_scores.json"
@@ -182,7 +243,7 @@ def main() -> None:
 
     # Persist conversation history
     session_log = "".join(conversation)
-    divider = "# Session on " + datetime.now(timezone.utc).isoformat(timespec="seconds") + "\n"
+    divider = "# Session on " + iso_now() + "\n"
     append_to_log(LOGS_DIR / "session_history.log", divider + session_log + "\n")
 
     # Present results to the terminal
@@ -192,4 +253,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())